@@ -24,21 +24,25 @@ Example usage:
     >>> printer.print(label)
 """
 
-from .connection import Connection, ConnectionNetwork, ConnectionUSB, PrinterConnectionError
-from .label import Align, Label, TextLabel
-from .printer import LabelPrinter, MediaType, TapeConfig
-from .printers import PTE550W, PTP750W, PTP900, PTP900W, PTP910BT, PTP950NW
-from .tape import (
-    HeatShrinkTape,
-    LaminatedTape,
-    LaminatedTape6mm,
-    LaminatedTape9mm,
-    LaminatedTape12mm,
-    LaminatedTape18mm,
-    LaminatedTape24mm,
-    LaminatedTape36mm,
-    Tape,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .connection import Connection, ConnectionNetwork, ConnectionUSB, PrinterConnectionError
+    from .label import Align, Label, TextLabel
+    from .printer import LabelPrinter, MediaType, TapeConfig
+    from .printers import PTE550W, PTP750W, PTP900, PTP900W, PTP910BT, PTP950NW
+    from .tape import (
+        HeatShrinkTape,
+        LaminatedTape,
+        LaminatedTape6mm,
+        LaminatedTape9mm,
+        LaminatedTape12mm,
+        LaminatedTape18mm,
+        LaminatedTape24mm,
+        LaminatedTape36mm,
+        Tape,
+    )
 
 __version__ = "1.0.0"
 
@@ -77,3 +81,52 @@ __all__ = [
     "Label",
     "TextLabel",
 ]
+
+# Submodule that provides each public attribute. Attributes are imported
+# lazily (PEP 562) so that importing ptouch does not pull in Pillow or
+# pyusb until a class that needs them is actually used. This keeps CLI
+# startup fast for --help and argument errors.
+_ATTR_MODULES = {
+    "Connection": "connection",
+    "ConnectionUSB": "connection",
+    "ConnectionNetwork": "connection",
+    "PrinterConnectionError": "connection",
+    "Align": "label",
+    "Label": "label",
+    "TextLabel": "label",
+    "LabelPrinter": "printer",
+    "MediaType": "printer",
+    "TapeConfig": "printer",
+    "PTE550W": "printers",
+    "PTP750W": "printers",
+    "PTP900": "printers",
+    "PTP900W": "printers",
+    "PTP910BT": "printers",
+    "PTP950NW": "printers",
+    "Tape": "tape",
+    "LaminatedTape": "tape",
+    "LaminatedTape6mm": "tape",
+    "LaminatedTape9mm": "tape",
+    "LaminatedTape12mm": "tape",
+    "LaminatedTape18mm": "tape",
+    "LaminatedTape24mm": "tape",
+    "LaminatedTape36mm": "tape",
+    "HeatShrinkTape": "tape",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve public attributes lazily from their submodules."""
+    try:
+        module_name = _ATTR_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    attribute = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so subsequent lookups skip __getattr__
+    globals()[name] = attribute
+    return attribute
+
+
+def __dir__() -> list[str]:
+    """List public attributes, including lazily loaded ones."""
+    return sorted(set(__all__) | set(globals()))
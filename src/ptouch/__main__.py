@@ -4,69 +4,284 @@
 
 """CLI interface for Brother P-touch label printers."""
 
+from __future__ import annotations
+
 import argparse
+import importlib
 import sys
-from typing import Sequence
-
-from PIL import Image, ImageFont
+import types
+from itertools import chain, repeat
+from typing import TYPE_CHECKING, Any, Iterator, Sequence
 
-from . import (
-    Align,
-    ConnectionNetwork,
-    ConnectionUSB,
-    Label,
+from .tape import (
     LaminatedTape6mm,
     LaminatedTape9mm,
     LaminatedTape12mm,
     LaminatedTape18mm,
     LaminatedTape24mm,
     LaminatedTape36mm,
-    PTE550W,
-    PTP750W,
-    PTP900,
-    PTP900W,
-    PTP910BT,
-    PTP950NW,
-    TextLabel,
 )
-from .printer import LabelPrinter
-
-# Mapping of tape width (mm) to tape classes
-TAPE_WIDTHS = {
-    6: LaminatedTape6mm,
-    9: LaminatedTape9mm,
-    12: LaminatedTape12mm,
-    18: LaminatedTape18mm,
-    24: LaminatedTape24mm,
-    36: LaminatedTape36mm,
-}
 
-# Mapping of printer names to printer classes
-PRINTER_TYPES = {
-    "E550W": PTE550W,
-    "P750W": PTP750W,
-    "P900": PTP900,
-    "P900W": PTP900W,
-    "P910BT": PTP910BT,
-    "P950NW": PTP950NW,
-}
+if TYPE_CHECKING:
+    from PIL import ImageFont
+
+    from .label import Align, TextLabel
+    from .printer import LabelPrinter
+
+# Mapping of tape width (mm) to tape classes (read-only, built once)
+TAPE_WIDTHS = types.MappingProxyType(
+    {
+        6: LaminatedTape6mm,
+        9: LaminatedTape9mm,
+        12: LaminatedTape12mm,
+        18: LaminatedTape18mm,
+        24: LaminatedTape24mm,
+        36: LaminatedTape36mm,
+    }
+)
 
-# Mapping of alignment strings to Align flags
+# Mapping of printer names to class names in ptouch.printers.
+# The classes are imported lazily so that Pillow/pyusb are only loaded
+# once a print job actually starts, keeping CLI startup (and --help) fast.
+PRINTER_TYPES = types.MappingProxyType(
+    {
+        "E550W": "PTE550W",
+        "P750W": "PTP750W",
+        "P900": "PTP900",
+        "P900W": "PTP900W",
+        "P910BT": "PTP910BT",
+        "P950NW": "PTP950NW",
+    }
+)
+
+# Mapping of alignment strings to Align flag names (resolved lazily, see above)
 ALIGN_HORIZONTAL = {
-    "left": Align.LEFT,
-    "center": Align.HCENTER,
-    "right": Align.RIGHT,
+    "left": "LEFT",
+    "center": "HCENTER",
+    "right": "RIGHT",
 }
 
 ALIGN_VERTICAL = {
-    "top": Align.TOP,
-    "center": Align.VCENTER,
-    "bottom": Align.BOTTOM,
+    "top": "TOP",
+    "center": "VCENTER",
+    "bottom": "BOTTOM",
 }
 
+# Argument choices, precomputed once at import so parse_args() does not
+# rebuild them per invocation and --help output stays deterministic
+_PRINTER_CHOICES = tuple(sorted(PRINTER_TYPES))
+_TAPE_CHOICES = tuple(sorted(TAPE_WIDTHS))
+
+
+class _AlignAction(argparse.Action):
+    """Validate and normalize the two --align values during parsing.
+
+    Invalid alignments fail inside argparse with a proper usage error
+    instead of being re-checked in main(). The stored value is a pair of
+    Align flag names, resolved lazily once the label module is loaded.
+    """
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: str | None = None,
+    ) -> None:
+        """Resolve and store the horizontal and vertical alignment names."""
+        horizontal, vertical = values
+        h_name = ALIGN_HORIZONTAL.get(horizontal.lower())
+        if h_name is None:
+            parser.error(
+                f"argument --align: invalid horizontal alignment '{horizontal}' "
+                "(choose from left, center, right)"
+            )
+        v_name = ALIGN_VERTICAL.get(vertical.lower())
+        if v_name is None:
+            parser.error(
+                f"argument --align: invalid vertical alignment '{vertical}' "
+                "(choose from top, center, bottom)"
+            )
+        setattr(namespace, self.dest, (h_name, v_name))
+
+
+def _load_printer_class(name: str) -> type[LabelPrinter]:
+    """Import and return the printer class for a CLI printer name.
+
+    Parameters
+    ----------
+    name : str
+        Printer name as used on the command line (e.g. "P900").
+
+    Returns
+    -------
+    type[LabelPrinter]
+        The printer class from ptouch.printers.
+    """
+    printers = importlib.import_module(".printers", package=__package__)
+    return getattr(printers, PRINTER_TYPES[name])
+
+
+# Boolean flags recognized by the fast parser, mapped to their dest
+_FAST_FLAGS = types.MappingProxyType(
+    {
+        "--usb": "usb",
+        "--high-resolution": "high_resolution",
+        "--no-compression": "no_compression",
+        "--full-cut": "full_cut",
+    }
+)
+
+
+def _printer_choice(value: str) -> str:
+    """Validate a --printer value, raising ValueError if unknown."""
+    if value not in PRINTER_TYPES:
+        raise ValueError(f"unknown printer: {value}")
+    return value
+
+
+def _tape_choice(value: str) -> int:
+    """Validate a --tape-width value, raising ValueError if unknown."""
+    width = int(value)
+    if width not in TAPE_WIDTHS:
+        raise ValueError(f"unknown tape width: {width}")
+    return width
+
+
+# Value-taking options recognized by the fast parser: option -> (dest, converter)
+_FAST_OPTIONS = types.MappingProxyType(
+    {
+        "--image": ("image", str),
+        "-i": ("image", str),
+        "--host": ("host", str),
+        "-H": ("host", str),
+        "--printer": ("printer", _printer_choice),
+        "-p": ("printer", _printer_choice),
+        "--tape-width": ("tape_width", _tape_choice),
+        "-t": ("tape_width", _tape_choice),
+        "--font": ("font", str),
+        "-f": ("font", str),
+        "--font-size": ("font_size", int),
+        "--margin": ("margin", float),
+        "-m": ("margin", float),
+        "--copies": ("copies", int),
+        "-c": ("copies", int),
+        "--width": ("width", float),
+        "-w": ("width", float),
+    }
+)
+
+
+def _fast_parse(argv: Sequence[str]) -> argparse.Namespace | None:
+    """Parse the common invocation shapes without building an ArgumentParser.
+
+    Handles plain "text... --option value" command lines with the known
+    options. Anything else - --help, unknown or malformed options,
+    "--option=value" forms, option-like values, text after an option,
+    constraint violations - returns None so the caller falls back to the
+    full argparse parser, which produces the proper error message or
+    help text.
+
+    Parameters
+    ----------
+    argv : Sequence[str]
+        Command line arguments without the program name.
+
+    Returns
+    -------
+    argparse.Namespace or None
+        Parsed namespace, or None if the full parser must be used.
+    """
+    values: dict[str, Any] = {
+        "image": None,
+        "host": None,
+        "usb": False,
+        "printer": None,
+        "tape_width": None,
+        "font": None,
+        "font_size": None,
+        "align": ("HCENTER", "VCENTER"),
+        "high_resolution": False,
+        "margin": None,
+        "no_compression": False,
+        "full_cut": False,
+        "copies": 1,
+        "width": None,
+    }
+    texts: list[str] = []
+    seen_option = False
+
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+        flag_dest = _FAST_FLAGS.get(token)
+        if flag_dest is not None:
+            values[flag_dest] = True
+            seen_option = True
+            i += 1
+            continue
+        if token in ("--align", "-a"):
+            if i + 2 >= len(argv):
+                return None
+            h_name = ALIGN_HORIZONTAL.get(argv[i + 1].lower())
+            v_name = ALIGN_VERTICAL.get(argv[i + 2].lower())
+            if h_name is None or v_name is None:
+                return None
+            values["align"] = (h_name, v_name)
+            seen_option = True
+            i += 3
+            continue
+        option = _FAST_OPTIONS.get(token)
+        if option is not None:
+            if i + 1 >= len(argv):
+                return None
+            value = argv[i + 1]
+            if value.startswith("-"):
+                # Option-like value (argparse reports "expected one
+                # argument") or a negative number; both go to argparse
+                return None
+            dest, convert = option
+            try:
+                values[dest] = convert(value)
+            except ValueError:
+                return None
+            seen_option = True
+            i += 2
+            continue
+        if token.startswith("-") and token != "-":
+            # --help, --option=value, or an unknown option
+            return None
+        if seen_option:
+            # argparse consumes all text positionals before the first
+            # option and rejects later ones as unrecognized arguments
+            return None
+        texts.append(token)
+        i += 1
+
+    # Constraint violations go through argparse for its error reporting
+    if values["printer"] is None or values["tape_width"] is None:
+        return None
+    if bool(values["host"]) == values["usb"]:  # exactly one connection required
+        return None
+
+    return argparse.Namespace(text=texts, **values)
+
 
 def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
+    """Parse command line arguments.
+
+    Tries the lightweight fast parser first; only non-trivial command
+    lines (including --help and all error cases) pay for constructing
+    the full ArgumentParser.
+    """
+    namespace = _fast_parse(sys.argv[1:])
+    if namespace is not None:
+        return namespace
+    return _build_parser().parse_args()
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the full argparse parser."""
     parser = argparse.ArgumentParser(
         prog="ptouch",
         description="Print labels on Brother P-touch printers.",
@@ -133,7 +348,7 @@ Examples:
         "--printer",
         "-p",
         required=True,
-        choices=list(set(PRINTER_TYPES.keys())),
+        choices=_PRINTER_CHOICES,
         help="Printer model",
     )
     parser.add_argument(
@@ -141,7 +356,7 @@ Examples:
         "-t",
         type=int,
         required=True,
-        choices=list(TAPE_WIDTHS.keys()),
+        choices=_TAPE_CHOICES,
         help="Tape width in mm",
     )
 
@@ -165,7 +380,8 @@ Examples:
         "-a",
         nargs=2,
         metavar=("H", "V"),
-        default=["center", "center"],
+        action=_AlignAction,
+        default=("HCENTER", "VCENTER"),
         help="Alignment: left|center|right top|center|bottom (default: center center)",
     )
 
@@ -208,7 +424,7 @@ Examples:
         help="Fixed label width in mm (default: auto-sized to content)",
     )
 
-    return parser.parse_args()
+    return parser
 
 
 def create_text_labels(
@@ -219,7 +435,7 @@ def create_text_labels(
     font_size: int | None = None,
     min_width_mm: float | None = None,
     auto_size: bool = True,
-) -> list[TextLabel]:
+) -> Iterator[TextLabel]:
     """Create TextLabel instances for multiple text strings.
 
     Parameters
@@ -239,13 +455,15 @@ def create_text_labels(
     auto_size : bool
         If True, auto-size font to 80% of print height.
 
-    Returns
-    -------
-    list[TextLabel]
-        List of TextLabel instances.
+    Yields
+    ------
+    TextLabel
+        One TextLabel per text string, created lazily.
     """
-    return [
-        TextLabel(
+    from .label import TextLabel
+
+    for text in texts:
+        yield TextLabel(
             text,
             tape_class,
             font=font,
@@ -254,8 +472,6 @@ def create_text_labels(
             min_width_mm=min_width_mm,
             auto_size=auto_size,
         )
-        for text in texts
-    ]
 
 
 def main() -> int:
@@ -275,128 +491,136 @@ def main() -> int:
         print("Error: --copies must be at least 1", file=sys.stderr)
         return 1
 
-    # Get printer and tape classes
-    printer_class = PRINTER_TYPES[args.printer]
+    # Get printer and tape classes (imports Pillow and the connection stack,
+    # so this only happens after argument validation has passed)
+    printer_class = _load_printer_class(args.printer)
     tape_class = TAPE_WIDTHS[args.tape_width]
 
     # Create connection
     if args.host:
+        from .connection import ConnectionNetwork
+
         connection = ConnectionNetwork(args.host)
     else:
+        from .connection import ConnectionUSB
+
         connection = ConnectionUSB()
 
-    # Create printer
-    use_compression = not args.no_compression
-    printer = printer_class(
-        connection,
-        use_compression=use_compression,
-        high_resolution=args.high_resolution,
-    )
+    # The context manager guarantees the connection is released on any
+    # exit path, without relying on garbage collection
+    with connection:
+        # Create printer
+        use_compression = not args.no_compression
+        printer = printer_class(
+            connection,
+            use_compression=use_compression,
+            high_resolution=args.high_resolution,
+        )
 
-    # Create label(s)
-    if args.image:
-        image = Image.open(args.image)
-        labels = [Label(image, tape_class)]
-    else:
-        # Parse alignment
-        h_align = ALIGN_HORIZONTAL.get(args.align[0].lower())
-        v_align = ALIGN_VERTICAL.get(args.align[1].lower())
-
-        if h_align is None:
-            print(
-                f"Error: Invalid horizontal alignment '{args.align[0]}'. Use: left, center, right",
-                file=sys.stderr,
-            )
-            return 1
-        if v_align is None:
-            print(
-                f"Error: Invalid vertical alignment '{args.align[1]}'. Use: top, center, bottom",
-                file=sys.stderr,
-            )
-            return 1
+        # Create label(s)
+        if args.image:
+            from PIL import Image
 
-        align = h_align | v_align
+            from .label import Label
 
-        # Determine font: use provided path or try default font
-        font: str | ImageFont.FreeTypeFont
-        if args.font:
-            font = args.font
+            image = Image.open(args.image)
+            labels = [Label(image, tape_class)]
         else:
-            try:
-                default_font = ImageFont.load_default()
-                # Check if it's a scalable font (has font_variant method)
-                if not hasattr(default_font, "font_variant") or not isinstance(
-                    default_font, ImageFont.FreeTypeFont
-                ):
+            from PIL import ImageFont
+
+            from .label import Align
+
+            # Alignment was validated during parsing; just resolve the flags
+            h_align_name, v_align_name = args.align
+            align = getattr(Align, h_align_name) | getattr(Align, v_align_name)
+
+            # Determine font: use provided path or try default font
+            font: str | ImageFont.FreeTypeFont
+            if args.font:
+                font = args.font
+            else:
+                try:
+                    default_font = ImageFont.load_default()
+                    # Check if it's a scalable font (has font_variant method)
+                    if not hasattr(default_font, "font_variant") or not isinstance(
+                        default_font, ImageFont.FreeTypeFont
+                    ):
+                        print(
+                            "Error: PIL default font is not scalable. "
+                            "Please upgrade Pillow to 10.1+ or provide --font",
+                            file=sys.stderr,
+                        )
+                        return 1
+                    font = default_font
+                except Exception as e:
+                    print(f"Error: Could not load default font: {e}", file=sys.stderr)
+                    print("Please provide --font with a path to a TrueType font", file=sys.stderr)
+                    return 1
+
+            # Calculate image width: --width is total label length, subtract margins (both sides)
+            margin_mm = args.margin if args.margin is not None else printer_class.DEFAULT_MARGIN_MM
+            min_width_mm = None
+            if args.width is not None:
+                min_width_mm = args.width - (2 * margin_mm)
+                if min_width_mm <= 0:
                     print(
-                        "Error: PIL default font is not scalable. "
-                        "Please upgrade Pillow to 10.1+ or provide --font",
+                        f"Error: --width must be greater than 2x margin ({2 * margin_mm}mm)",
                         file=sys.stderr,
                     )
                     return 1
-                font = default_font
-            except Exception as e:
-                print(f"Error: Could not load default font: {e}", file=sys.stderr)
-                print("Please provide --font with a path to a TrueType font", file=sys.stderr)
-                return 1
-
-        # Calculate image width: --width is total label length, subtract margins (both sides)
-        margin_mm = args.margin if args.margin is not None else LabelPrinter.DEFAULT_MARGIN_MM
-        min_width_mm = None
-        if args.width is not None:
-            min_width_mm = args.width - (2 * margin_mm)
-            if min_width_mm <= 0:
-                print(
-                    f"Error: --width must be greater than 2x margin ({2 * margin_mm}mm)",
-                    file=sys.stderr,
-                )
-                return 1
 
-        # auto_size=True (default) unless font_size is explicitly set
-        auto_size = args.font_size is None
+            # auto_size=True (default) unless font_size is explicitly set
+            auto_size = args.font_size is None
+
+            labels = create_text_labels(
+                args.text,
+                tape_class,
+                font=font,
+                align=align,
+                font_size=args.font_size,
+                min_width_mm=min_width_mm,
+                auto_size=auto_size,
+            )
 
-        labels = create_text_labels(
-            args.text,
-            tape_class,
-            font=font,
-            align=align,
-            font_size=args.font_size,
-            min_width_mm=min_width_mm,
-            auto_size=auto_size,
+        # Apply copies. Each label object is repeated by reference, and label
+        # rendering is idempotent, so each unique label is rendered once no
+        # matter how many copies are printed.
+        if args.copies > 1:
+            labels = chain.from_iterable(repeat(label, args.copies) for label in labels)
+
+        # print()/print_multi() need len() and indexing, so materialize here
+        labels = list(labels)
+
+        # Print
+        num_labels = len(labels)
+        use_half_cut = not args.full_cut
+        conn_type = "network" if args.host else "USB"
+        print(f"Printing {num_labels} label(s) to {printer_class.__name__} via {conn_type}...")
+        print(
+            f"Tape: {args.tape_width}mm, High-res: {args.high_resolution}, "
+            f"Compression: {use_compression}"
         )
-
-    # Apply copies
-    if args.copies > 1:
-        labels = labels * args.copies
-
-    # Print
-    num_labels = len(labels)
-    use_half_cut = not args.full_cut
-    conn_type = "network" if args.host else "USB"
-    print(f"Printing {num_labels} label(s) to {printer_class.__name__} via {conn_type}...")
-    print(
-        f"Tape: {args.tape_width}mm, High-res: {args.high_resolution}, "
-        f"Compression: {use_compression}"
-    )
-    if num_labels > 1:
-        cut_type = "half-cut" if use_half_cut else "full-cut"
-        print(f"Using {cut_type} between labels, full cut after last label.")
-
-    try:
-        if num_labels == 1:
-            printer.print(labels[0], margin_mm=args.margin, high_resolution=args.high_resolution)
-        else:
-            printer.print_multi(
-                labels,
-                margin_mm=args.margin,
-                high_resolution=args.high_resolution,
-                half_cut=use_half_cut,
-            )
-        print("Done.")
-        return 0
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return 1
+        if num_labels > 1:
+            cut_type = "half-cut" if use_half_cut else "full-cut"
+            print(f"Using {cut_type} between labels, full cut after last label.")
+
+        try:
+            if num_labels == 1:
+                printer.print(
+                    labels[0], margin_mm=args.margin, high_resolution=args.high_resolution
+                )
+            else:
+                printer.print_multi(
+                    labels,
+                    margin_mm=args.margin,
+                    high_resolution=args.high_resolution,
+                    half_cut=use_half_cut,
+                )
+            print("Done.")
+            return 0
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
 
 
 if __name__ == "__main__":
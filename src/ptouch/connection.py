@@ -7,9 +7,10 @@
 from __future__ import annotations
 
 import errno
+import os
 import socket
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO, NoReturn
 
 import usb.core
 import usb.util
@@ -20,6 +21,19 @@ if TYPE_CHECKING:
 # USB vendor ID for Brother Industries
 USB_VENDOR_ID = 0x04F9
 
+# Endpoint addresses discovered per (vendor_id, product_id), so reconnects
+# to a known device skip the Python-level descriptor scans
+_ENDPOINT_CACHE: dict[tuple[int, int], tuple[int, int]] = {}
+
+# Maximum number of buffers the kernel accepts per sendmsg() call (EINVAL
+# beyond it); larger batches are sent in successive calls
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):  # pragma: no cover - non-POSIX
+    _IOV_MAX = 1024
+if _IOV_MAX <= 0:  # pragma: no cover - limit reported as indeterminate
+    _IOV_MAX = 1024
+
 
 class PrinterConnectionError(Exception):
     """Exception raised when connection to printer fails.
@@ -40,6 +54,36 @@ class PrinterConnectionError(Exception):
 class Connection(ABC):
     """Abstract base class for printer connections."""
 
+    # Buffer for batched writes; None means writes go out immediately
+    _batch: bytearray | None = None
+
+    def begin_batch(self) -> None:
+        """Start buffering writes into a single transfer.
+
+        Until end_batch() is called, write() calls collect their payloads
+        in memory instead of sending them. Batching avoids one syscall (and
+        for USB one transfer setup) per write, which matters when a print
+        job is assembled from many small command and raster chunks.
+        """
+        self._batch = bytearray()
+
+    def end_batch(self) -> None:
+        """Send all buffered writes as one transfer and leave batch mode."""
+        if self._batch is None:
+            return
+        buffered = bytes(self._batch)
+        self._batch = None
+        if buffered:
+            self.write(buffered)
+
+    def abort_batch(self) -> None:
+        """Discard buffered writes and leave batch mode without sending.
+
+        Called when assembling a batch fails partway, so the connection
+        does not keep buffering (and never sending) subsequent writes.
+        """
+        self._batch = None
+
     @abstractmethod
     def connect(self, printer: LabelPrinter) -> None:
         """Establish the connection to the printer.
@@ -84,8 +128,12 @@ class Connection(ABC):
         """
         raise NotImplementedError("This connection does not support reading")
 
-    def __del__(self) -> None:
-        """Clean up connection on garbage collection."""
+    def __enter__(self) -> Connection:
+        """Return the connection for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the connection when leaving the context."""
         self.close()
 
 
@@ -156,16 +204,40 @@ class ConnectionUSB(Connection):
 
         cfg = self._device.get_active_configuration()
         intf = usb.util.find_descriptor(cfg, bInterfaceClass=7)
-        assert intf is not None
+        if intf is None:
+            raise PrinterConnectionError("Interface class 7 (printer) not found on USB device")
+
+        self._ep_in = None
+        self._ep_out = None
+
+        # Fast path: endpoint addresses already discovered for this device
+        cache_key = (USB_VENDOR_ID, product_id)
+        cached = _ENDPOINT_CACHE.get(cache_key)
+        if cached is not None:
+            ep_in_addr, ep_out_addr = cached
+            for endpoint in intf:
+                if endpoint.bEndpointAddress == ep_in_addr:
+                    self._ep_in = endpoint
+                elif endpoint.bEndpointAddress == ep_out_addr:
+                    self._ep_out = endpoint
 
-        def match_endpoint_in(endpoint: Any) -> bool:
-            return usb.util.endpoint_direction(endpoint.bEndpointAddress) == usb.util.ENDPOINT_IN
-
-        def match_endpoint_out(endpoint: Any) -> bool:
-            return usb.util.endpoint_direction(endpoint.bEndpointAddress) == usb.util.ENDPOINT_OUT
-
-        self._ep_in = usb.util.find_descriptor(intf, custom_match=match_endpoint_in)
-        self._ep_out = usb.util.find_descriptor(intf, custom_match=match_endpoint_out)
+        if self._ep_in is None or self._ep_out is None:
+            # Cold path: categorize endpoints by the direction bit of their
+            # address in a single pass (bit 7 set means device-to-host)
+            for endpoint in intf:
+                if endpoint.bEndpointAddress & usb.util.ENDPOINT_IN:
+                    if self._ep_in is None:
+                        self._ep_in = endpoint
+                elif self._ep_out is None:
+                    self._ep_out = endpoint
+                if self._ep_in is not None and self._ep_out is not None:
+                    break
+
+            if self._ep_in is not None and self._ep_out is not None:
+                _ENDPOINT_CACHE[cache_key] = (
+                    self._ep_in.bEndpointAddress,
+                    self._ep_out.bEndpointAddress,
+                )
 
         if self._ep_in is None or self._ep_out is None:
             raise PrinterConnectionError(
@@ -174,6 +246,9 @@ class ConnectionUSB(Connection):
 
     def write(self, payload: bytes) -> None:
         """Write data to the printer via USB."""
+        if self._batch is not None:
+            self._batch.extend(payload)
+            return
         self._ep_out.write(payload, len(payload))
 
     def close(self) -> None:
@@ -205,10 +280,68 @@ class ConnectionNetwork(Connection):
 
     def __init__(self, host: str, port: int = 9100, timeout: float = 5.0) -> None:
         self._socket: socket.socket | None = None
+        self._batch_chunks: list[bytes] | None = None
         self.host = host
         self.port = port
         self.timeout = timeout
 
+    def begin_batch(self) -> None:
+        """Start buffering writes as a scatter/gather chunk list.
+
+        Unlike the base implementation, the chunks are kept separate and
+        handed to the kernel via sendmsg() on end_batch(), avoiding the
+        copy into one contiguous buffer.
+        """
+        self._batch_chunks = []
+
+    def end_batch(self) -> None:
+        """Send all buffered chunks in a single scatter/gather transfer.
+
+        Raises
+        ------
+        PrinterConnectionError
+            If sending to the printer fails or times out.
+        """
+        if self._batch_chunks is None:
+            return
+        chunks = self._batch_chunks
+        self._batch_chunks = None
+        if not chunks:
+            return
+
+        if self._socket is None:
+            raise PrinterConnectionError("Not connected to printer")
+
+        if not hasattr(self._socket, "sendmsg"):  # pragma: no cover - POSIX always has it
+            self.write(b"".join(chunks))
+            return
+
+        try:
+            self._sendmsg_all(chunks)
+        except OSError as e:
+            self._raise_io_error(e, "write")
+
+    def abort_batch(self) -> None:
+        """Discard buffered chunks and leave batch mode without sending."""
+        self._batch_chunks = None
+
+    def _sendmsg_all(self, chunks: list[bytes]) -> None:
+        """Send all chunks via sendmsg, resuming after partial writes.
+
+        The caller must ensure the socket is connected.
+        """
+        buffers = [memoryview(chunk) for chunk in chunks]
+        while buffers:
+            # Cap the vector length at the kernel's IOV_MAX; jobs with more
+            # chunks than that simply take additional sendmsg calls
+            sent = self._socket.sendmsg(buffers[:_IOV_MAX])
+            # Drop fully sent buffers, slice a partially sent one
+            while buffers and sent >= len(buffers[0]):
+                sent -= len(buffers[0])
+                buffers.pop(0)
+            if sent and buffers:
+                buffers[0] = buffers[0][sent:]
+
     def connect(self, printer: LabelPrinter) -> None:
         """Establish network connection to the printer.
 
@@ -224,43 +357,80 @@ class ConnectionNetwork(Connection):
         """
         del printer  # unused for network connections
 
-        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            # create_connection handles name resolution (IPv4 and IPv6)
+            # and cleans up its socket on failure
+            self._socket = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        except OSError as e:
+            self._raise_connect_error(e)
+
         # Disable Nagle's algorithm to send packets immediately
         self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-        self._socket.settimeout(self.timeout)
+        # Large send buffer so big raster payloads drain without throttling
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+        if hasattr(socket, "TCP_QUICKACK"):  # Linux only
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
 
-        try:
-            self._socket.connect((self.host, self.port))
-        except socket.timeout as e:
-            self._socket.close()
-            self._socket = None
-            raise PrinterConnectionError(
-                f"Connection to printer at {self.host}:{self.port} timed out after {self.timeout}s",
-                original_error=e,
-            ) from e
-        except ConnectionRefusedError as e:
-            self._socket.close()
-            self._socket = None
-            raise PrinterConnectionError(
+    def _raise_connect_error(self, error: OSError) -> NoReturn:
+        """Translate an OSError from connect() into PrinterConnectionError.
+
+        Formatting the message only happens here, on the failure path, so
+        the success path carries no inline error-string construction.
+
+        Parameters
+        ----------
+        error : OSError
+            The exception raised by socket.create_connection.
+
+        Raises
+        ------
+        PrinterConnectionError
+            Always; with a message matching the failure kind.
+        """
+        if isinstance(error, socket.timeout):
+            message = (
+                f"Connection to printer at {self.host}:{self.port} timed out after {self.timeout}s"
+            )
+        elif isinstance(error, ConnectionRefusedError):
+            message = (
                 f"Connection refused by printer at {self.host}:{self.port}. "
-                "Check if the printer is powered on and accepts network connections.",
-                original_error=e,
-            ) from e
-        except socket.gaierror as e:
-            self._socket.close()
-            self._socket = None
-            raise PrinterConnectionError(
+                "Check if the printer is powered on and accepts network connections."
+            )
+        elif isinstance(error, socket.gaierror):
+            message = (
                 f"Cannot resolve hostname '{self.host}'. "
-                "Check if the hostname or IP address is correct.",
-                original_error=e,
-            ) from e
-        except OSError as e:
-            self._socket.close()
-            self._socket = None
-            raise PrinterConnectionError(
-                f"Failed to connect to printer at {self.host}:{self.port}: {e}",
-                original_error=e,
-            ) from e
+                "Check if the hostname or IP address is correct."
+            )
+        else:
+            message = f"Failed to connect to printer at {self.host}:{self.port}: {error}"
+        raise PrinterConnectionError(message, original_error=error) from error
+
+    def _raise_io_error(self, error: OSError, operation: str) -> NoReturn:
+        """Translate an OSError from a read/write into PrinterConnectionError.
+
+        Parameters
+        ----------
+        error : OSError
+            The exception raised by the socket operation.
+        operation : str
+            Either "write" or "read", used in the message.
+
+        Raises
+        ------
+        PrinterConnectionError
+            Always; with a message matching the failure kind.
+        """
+        if isinstance(error, socket.timeout):
+            direction = "Write to" if operation == "write" else "Read from"
+            message = f"{direction} printer at {self.host}:{self.port} timed out"
+        elif isinstance(error, (BrokenPipeError, ConnectionResetError)):
+            message = f"Connection to printer at {self.host}:{self.port} was lost"
+        else:
+            preposition = "to" if operation == "write" else "from"
+            message = (
+                f"Failed to {operation} {preposition} printer at {self.host}:{self.port}: {error}"
+            )
+        raise PrinterConnectionError(message, original_error=error) from error
 
     def write(self, payload: bytes) -> None:
         """Write data to the printer via network.
@@ -270,26 +440,44 @@ class ConnectionNetwork(Connection):
         PrinterConnectionError
             If writing to the printer fails or times out.
         """
+        if self._batch_chunks is not None:
+            self._batch_chunks.append(bytes(payload))
+            return
+
         if self._socket is None:
             raise PrinterConnectionError("Not connected to printer")
 
         try:
             self._socket.sendall(payload)
-        except socket.timeout as e:
-            raise PrinterConnectionError(
-                f"Write to printer at {self.host}:{self.port} timed out",
-                original_error=e,
-            ) from e
-        except (BrokenPipeError, ConnectionResetError) as e:
-            raise PrinterConnectionError(
-                f"Connection to printer at {self.host}:{self.port} was lost",
-                original_error=e,
-            ) from e
         except OSError as e:
-            raise PrinterConnectionError(
-                f"Failed to write to printer at {self.host}:{self.port}: {e}",
-                original_error=e,
-            ) from e
+            self._raise_io_error(e, "write")
+
+    def write_from(self, fileobj: BinaryIO) -> None:
+        """Send the contents of a file-like object to the printer.
+
+        Uses socket.sendfile, which performs a zero-copy sendfile(2)
+        transfer for regular files (e.g. a spooled raster cache) and
+        transparently falls back to a send loop for other file objects
+        such as io.BytesIO.
+
+        Parameters
+        ----------
+        fileobj : BinaryIO
+            Binary file-like object open for reading, positioned at the
+            start of the data to send.
+
+        Raises
+        ------
+        PrinterConnectionError
+            If writing to the printer fails or times out.
+        """
+        if self._socket is None:
+            raise PrinterConnectionError("Not connected to printer")
+
+        try:
+            self._socket.sendfile(fileobj)
+        except OSError as e:
+            self._raise_io_error(e, "write")
 
     def read(self, num_bytes: int = 1024) -> bytes:
         """Read data from the printer via network.
@@ -304,21 +492,8 @@ class ConnectionNetwork(Connection):
 
         try:
             return self._socket.recv(num_bytes)
-        except socket.timeout as e:
-            raise PrinterConnectionError(
-                f"Read from printer at {self.host}:{self.port} timed out",
-                original_error=e,
-            ) from e
-        except (BrokenPipeError, ConnectionResetError) as e:
-            raise PrinterConnectionError(
-                f"Connection to printer at {self.host}:{self.port} was lost",
-                original_error=e,
-            ) from e
         except OSError as e:
-            raise PrinterConnectionError(
-                f"Failed to read from printer at {self.host}:{self.port}: {e}",
-                original_error=e,
-            ) from e
+            self._raise_io_error(e, "read")
 
     def close(self) -> None:
         """Close the network connection."""
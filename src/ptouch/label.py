@@ -4,13 +4,188 @@
 
 """Label classes for Brother P-touch label printers."""
 
-from enum import Flag, auto
+import functools
+from enum import IntFlag, auto
+from typing import Sequence
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageFont
 
 from .tape import Tape
 
 
+@functools.lru_cache(maxsize=64)
+def _load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font, caching FreeType faces by (path, size).
+
+    Re-parsing the font file for every label dominates prepare() time in
+    batch workflows. Sharing instances is safe since rendering only reads
+    from them. Tests can reset the cache via ``_load_font.cache_clear()``.
+    """
+    return ImageFont.truetype(path, size)
+
+
+@functools.lru_cache(maxsize=None)
+def _mm_to_px(mm: float, dpi: int) -> int:
+    """Convert millimeters to pixels at the given resolution, memoized."""
+    return int(mm * dpi / 25.4)
+
+
+# Canvases above this many bytes (L mode: one byte per pixel) are neither
+# pooled nor cached, so pathological text or min_width_mm values cannot
+# pin megabyte-scale buffers in memory after printing
+_LARGE_CANVAS_BYTES = 8 * 1024 * 1024
+
+# Horizontal whitespace around the rendered text, in pixels
+_PADDING = 10
+
+
+class _ImagePool:
+    """Reuse pool for rendered label canvases, keyed by size.
+
+    Batch jobs render many same-sized canvases; reusing released ones
+    replaces a malloc + fill per label with a single C-level fill.
+    """
+
+    def __init__(self, max_per_size: int = 4) -> None:
+        self._free: dict[tuple[int, int], list[Image.Image]] = {}
+        self._max_per_size = max_per_size
+
+    def acquire(self, width: int, height: int) -> Image.Image:
+        """Return a white L-mode canvas, reusing a released one if available."""
+        stack = self._free.get((width, height))
+        if stack:
+            image = stack.pop()
+            image.paste(255, (0, 0, width, height))
+            return image
+        return Image.new("L", (width, height), 255)
+
+    def release(self, image: Image.Image) -> None:
+        """Return a canvas to the pool for later reuse.
+
+        Oversized canvases are dropped so they are freed promptly instead
+        of being retained for a size that is unlikely to repeat.
+        """
+        if image.width * image.height > _LARGE_CANVAS_BYTES:
+            return
+        stack = self._free.setdefault(image.size, [])
+        if len(stack) < self._max_per_size:
+            stack.append(image)
+
+
+_image_pool = _ImagePool()
+
+
+def _render_text(
+    font: ImageFont.FreeTypeFont,
+    text: str,
+    height: int,
+    resolution_dpi: int,
+    min_width_mm: float | None,
+    halign: int,
+    valign: int,
+) -> Image.Image:
+    """Render text onto a white L-mode canvas.
+
+    Parameters
+    ----------
+    font : ImageFont.FreeTypeFont
+        Resolved font to render with.
+    text : str
+        Text to render.
+    height : int
+        Image height in pixels (tape_config.print_pins).
+    resolution_dpi : int
+        Printer resolution in DPI for mm to pixel conversion.
+    min_width_mm : float or None
+        Minimum label width in millimeters, if any.
+    halign, valign : int
+        Alignment dispatch-table indices (0 = left/top, 1 = center,
+        2 = right/bottom).
+
+    Returns
+    -------
+    PIL.Image.Image
+        The rendered canvas.
+    """
+    # Measure text size without a throwaway image/Draw object; for the
+    # default anchor this matches ImageDraw.textbbox((0, 0), ...). The
+    # bbox serves both the width measurement and the paste offsets below,
+    # so one layout pass covers everything; font.getlength would be a
+    # second pass (and measures the advance, not the ink extent).
+    bbox = font.getbbox(text)
+    text_width = bbox[2] - bbox[0]
+
+    # Create image with padding
+    image_width = int(text_width + 2 * _PADDING)
+
+    # Apply minimum width if specified
+    if min_width_mm is not None:
+        image_width = max(image_width, _mm_to_px(min_width_mm, resolution_dpi))
+
+    # Grayscale is enough for black-on-white text and moves a third of
+    # the bytes an RGB canvas would; printing thresholds to 1-bit anyway
+    image = _image_pool.acquire(image_width, height)
+
+    text_x = _HALIGN_OFFSETS[halign](image_width, bbox, _PADDING)
+    text_y = _VALIGN_OFFSETS[valign](height, bbox)
+
+    # Render once via the glyph mask and alpha-paste it onto the canvas.
+    # This skips the ImageDraw context and the second FreeType layout
+    # pass inside ImageDraw.text; placement is pixel-identical to
+    # draw.text((text_x, text_y), ...) with the default anchor.
+    mask = Image.Image()._new(font.getmask(text, mode="L"))
+    image.paste(0, (text_x + bbox[0], text_y + bbox[1]), mask)
+
+    return image
+
+
+@functools.lru_cache(maxsize=32)
+def _render_raw(
+    text: str,
+    font_path: str,
+    font_size: int,
+    height: int,
+    resolution_dpi: int,
+    min_width_mm: float | None,
+    halign: int,
+    valign: int,
+) -> tuple[bytes | None, tuple[int, int]]:
+    """Render to raw pixel data, content-addressed by all render inputs.
+
+    Only used for path-based fonts, whose identity is fully captured by
+    (path, size); repeat prints of the same label reconstruct the image
+    from the cached bytes instead of re-rendering.
+
+    Oversized renders return ``(None, size)`` without rendering, so the
+    LRU entry pins only the small sentinel and the caller falls back to
+    the uncached render path.
+    """
+    font = _load_font(font_path, font_size)
+    bbox = font.getbbox(text)
+    image_width = int(bbox[2] - bbox[0] + 2 * _PADDING)
+    if min_width_mm is not None:
+        image_width = max(image_width, _mm_to_px(min_width_mm, resolution_dpi))
+    if image_width * height > _LARGE_CANVAS_BYTES:
+        return None, (image_width, height)
+    image = _render_text(font, text, height, resolution_dpi, min_width_mm, halign, valign)
+    return image.tobytes(), image.size
+
+
+# Text origin dispatch tables indexed by the alignment codes precomputed in
+# TextLabel.__init__ (0 = left/top, 1 = center, 2 = right/bottom); each entry
+# accounts for the bbox offset of the rendered text.
+_HALIGN_OFFSETS = (
+    lambda width, bbox, padding: padding - bbox[0],
+    lambda width, bbox, padding: (width - bbox[0] - bbox[2]) // 2,
+    lambda width, bbox, padding: width - padding - bbox[2],
+)
+_VALIGN_OFFSETS = (
+    lambda height, bbox: -bbox[1],
+    lambda height, bbox: (height - bbox[1] - bbox[3]) // 2,
+    lambda height, bbox: height - bbox[3],
+)
+
+
 class Label:
     """A label to be printed on a specific tape.
 
@@ -58,7 +233,7 @@ class TextLabel(Label):
     height for the printer/tape combination.
     """
 
-    class Align(Flag):
+    class Align(IntFlag):
         """Text alignment options. Combine with | operator, e.g. Align.LEFT | Align.TOP."""
 
         LEFT = auto()
@@ -113,9 +288,18 @@ class TextLabel(Label):
         self.font = font
         self.font_size = font_size
         self.align = align if align is not None else TextLabel.Align.CENTER
+        # Resolve alignment to dispatch-table indices once instead of
+        # re-running Flag membership tests on every render
+        Align = TextLabel.Align
+        self._halign = 0 if self.align & Align.LEFT else 2 if self.align & Align.RIGHT else 1
+        self._valign = 0 if self.align & Align.TOP else 2 if self.align & Align.BOTTOM else 1
         self.min_width_mm = min_width_mm
         self.auto_size = auto_size
         self._image: Image.Image | None = None
+        # Specialize for the dominant default configuration so renders
+        # skip the min-width and alignment branches entirely
+        if min_width_mm is None and self.align == Align.CENTER:
+            self.prepare = self._prepare_fast
 
     @property
     def image(self) -> Image.Image:
@@ -139,65 +323,115 @@ class TextLabel(Label):
         """
         if self._image is not None:
             return  # Already rendered
+        font = self._resolve_font(height)
+        if isinstance(self.font, str):
+            # Path fonts are fully described by (path, size), so the render
+            # can be served from the content-addressed cache on repeats;
+            # oversized renders come back as a sentinel and render uncached
+            data, size = _render_raw(
+                self.text,
+                self.font,
+                font.size,
+                height,
+                resolution_dpi,
+                self.min_width_mm,
+                self._halign,
+                self._valign,
+            )
+            if data is not None:
+                self._image = Image.frombytes("L", size, data)
+                return
+        self._render(font, height, resolution_dpi)
+
+    def _prepare_fast(self, height: int, resolution_dpi: int = 180) -> None:
+        """Render with both-centered alignment and no minimum width.
+
+        Bound as ``prepare`` in __init__ for the default configuration;
+        inlines the render with the centered offsets so no per-render
+        branching is left on the hot path.
+        """
+        if self._image is not None:
+            return  # Already rendered
+        font = self._resolve_font(height)
+        if isinstance(self.font, str):
+            data, size = _render_raw(
+                self.text, self.font, font.size, height, resolution_dpi, None, 1, 1
+            )
+            if data is not None:
+                self._image = Image.frombytes("L", size, data)
+                return
+
+        bbox = font.getbbox(self.text)
+        image_width = int(bbox[2] - bbox[0] + 2 * _PADDING)
+        image = _image_pool.acquire(image_width, height)
+        text_x = (image_width - bbox[0] - bbox[2]) // 2
+        text_y = (height - bbox[1] - bbox[3]) // 2
+        mask = Image.Image()._new(font.getmask(self.text, mode="L"))
+        image.paste(0, (text_x + bbox[0], text_y + bbox[1]), mask)
+        self._image = image
+
+    @classmethod
+    def prepare_batch(
+        cls, labels: "Sequence[TextLabel]", height: int, resolution_dpi: int = 180
+    ) -> None:
+        """Render multiple text labels, resolving each distinct font once.
+
+        Labels are grouped by their resolved font so FreeType face setup
+        happens once per group rather than once per label; labels that
+        are already rendered are skipped.
 
+        Parameters
+        ----------
+        labels : Sequence[TextLabel]
+            Labels to render.
+        height : int
+            Image height in pixels (tape_config.print_pins).
+        resolution_dpi : int, default 180
+            Printer resolution in DPI for mm to pixel conversion.
+        """
+        groups: dict[int, tuple[ImageFont.FreeTypeFont, list[TextLabel]]] = {}
+        for label in labels:
+            if label._image is not None:
+                continue
+            font = label._resolve_font(height)
+            groups.setdefault(id(font), (font, []))[1].append(label)
+        for font, members in groups.values():
+            for label in members:
+                label._render(font, height, resolution_dpi)
+
+    def _resolve_font(self, height: int) -> ImageFont.FreeTypeFont:
+        """Resolve the font to render with for the given print height."""
         if self.auto_size:
             # Auto-size font to 80% of print height
             font_size = int(height * 0.8)
             if isinstance(self.font, str):
-                font = ImageFont.truetype(self.font, font_size)
-            else:
-                # ImageFont object - use font_variant() to create scaled version
-                if hasattr(self.font, "font_variant"):
-                    font = self.font.font_variant(size=font_size)
-                else:
-                    # Can't auto-size (e.g., bitmap font), use as-is
-                    font = self.font
-        else:
-            # Use explicit font_size or ImageFont's built-in size
-            if isinstance(self.font, str):
-                font_size = self.font_size if self.font_size is not None else int(height * 0.8)
-                font = ImageFont.truetype(self.font, font_size)
-            else:
-                font = self.font
-
-        # Measure text size
-        temp_img = Image.new("RGB", (1, 1))
-        temp_draw = ImageDraw.Draw(temp_img)
-        bbox = temp_draw.textbbox((0, 0), self.text, font=font)
-        text_width = bbox[2] - bbox[0]
-
-        # Create image with padding
-        padding = 10
-        image_width = int(text_width + 2 * padding)
-
-        # Apply minimum width if specified
-        if self.min_width_mm is not None:
-            min_width_px = int(self.min_width_mm * resolution_dpi / 25.4)
-            image_width = max(image_width, min_width_px)
-
-        image = Image.new("RGB", (image_width, height), (255, 255, 255))
-
-        draw = ImageDraw.Draw(image)
-
-        # Horizontal alignment (account for bbox offset)
-        if TextLabel.Align.LEFT in self.align:
-            text_x = padding - bbox[0]
-        elif TextLabel.Align.RIGHT in self.align:
-            text_x = image_width - padding - bbox[2]
-        else:  # HCENTER (default)
-            text_x = (image_width - bbox[0] - bbox[2]) // 2
-
-        # Vertical alignment (account for bbox offset)
-        if TextLabel.Align.TOP in self.align:
-            text_y = -bbox[1]
-        elif TextLabel.Align.BOTTOM in self.align:
-            text_y = height - bbox[3]
-        else:  # VCENTER (default)
-            text_y = (height - bbox[1] - bbox[3]) // 2
-
-        draw.text((text_x, text_y), self.text, font=font, fill=(0, 0, 0))
-
-        self._image = image
+                return _load_font(self.font, font_size)
+            # ImageFont object - use font_variant() to create scaled version
+            if hasattr(self.font, "font_variant"):
+                return self.font.font_variant(size=font_size)
+            # Can't auto-size (e.g., bitmap font), use as-is
+            return self.font
+        # Use explicit font_size or ImageFont's built-in size
+        if isinstance(self.font, str):
+            font_size = self.font_size if self.font_size is not None else int(height * 0.8)
+            return _load_font(self.font, font_size)
+        return self.font
+
+    def _render(self, font: ImageFont.FreeTypeFont, height: int, resolution_dpi: int) -> None:
+        """Render the text with an already-resolved font."""
+        self._image = _render_text(
+            font, self.text, height, resolution_dpi, self.min_width_mm, self._halign, self._valign
+        )
+
+    def release(self) -> None:
+        """Return the rendered canvas to the image pool.
+
+        Opt-in: call this once the image is no longer needed (e.g. after
+        printing). The label renders again on the next prepare().
+        """
+        if self._image is not None:
+            _image_pool.release(self._image)
+            self._image = None
 
 
 # Backwards compatibility alias
@@ -7,6 +7,7 @@
 import logging
 import struct
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from math import ceil
@@ -50,6 +51,10 @@ class MediaType(Enum):
 
 logger = logging.getLogger(__name__)
 
+# Background color for the RGB container image, built once instead of
+# reallocating the tuple on every print
+_WHITE = (255, 255, 255)
+
 
 class LabelPrinter(ABC):
     """Abstract base class for Brother P-touch label printers.
@@ -337,7 +342,7 @@ class LabelPrinter(ABC):
         config = tape_config
 
         # Create container image with proper height
-        container_image = Image.new("RGB", (image.width, config.print_pins), (255, 255, 255))
+        container_image = Image.new("RGB", (image.width, config.print_pins), _WHITE)
         # Compensate for asymmetric physical margins (left_pins vs right_pins)
         # to center content on the physical tape, not just within print area
         pin_offset = (config.right_pins - config.left_pins) // 2
@@ -368,7 +373,8 @@ class LabelPrinter(ABC):
 
         # Use pixel access object for faster pixel reading
         pixels = img_1bit.load()
-        assert pixels is not None, "Failed to load image pixels"
+        if pixels is None:
+            raise RuntimeError("Failed to load image pixels")
 
         # Pre-allocate column bits array (reused for each column)
         column_bits = [0] * self.TOTAL_PINS
@@ -561,6 +567,33 @@ class LabelPrinter(ABC):
 
         return raster_data
 
+    def _render_label(
+        self, label: Label, tape_config: TapeConfig, high_resolution: bool
+    ) -> tuple[bytes, int, tuple[int, int]]:
+        """Render a label to printer-ready raster data.
+
+        Parameters
+        ----------
+        label : Label
+            Label to render.
+        tape_config : TapeConfig
+            Pin configuration for the tape.
+        high_resolution : bool
+            Whether to use high resolution mode.
+
+        Returns
+        -------
+        tuple[bytes, int, tuple[int, int]]
+            Raster data, number of raster lines, and the image size.
+        """
+        label.prepare(tape_config.print_pins, self.RESOLUTION_DPI)
+        image = label.image
+        img_1bit = self._prepare_image(image, tape_config)
+        raster = self._generate_raster(img_1bit, tape_config)
+        num_lines = image.width
+        raster_data = self._build_raster_data(raster, num_lines, high_resolution)
+        return raster_data, num_lines, image.size
+
     def print(
         self,
         label: Label,
@@ -623,9 +656,19 @@ class LabelPrinter(ABC):
 
         raster_data = self._build_raster_data(raster, num_lines, high_res)
 
-        # Send all data to printer in one write to avoid TCP fragmentation issues
-        all_data = control_seq + raster_data + b"\x1a" + self._cmd_invalidate_and_initialize()
-        self.connection.write(all_data)
+        # Batch all writes into one transfer to avoid TCP fragmentation issues
+        self.connection.begin_batch()
+        try:
+            self.connection.write(control_seq)
+            self.connection.write(raster_data)
+            self.connection.write(b"\x1a")
+            self.connection.write(self._cmd_invalidate_and_initialize())
+        except BaseException:
+            # Drop the partial batch so the connection does not stay in
+            # batch mode, silently buffering all later writes
+            self.connection.abort_batch()
+            raise
+        self.connection.end_batch()
 
         logger.info("Sent all data to printer.")
 
@@ -694,49 +737,56 @@ class LabelPrinter(ABC):
         else:
             logger.info(f"Resolution: Standard ({self.RESOLUTION_DPI}x{self.RESOLUTION_DPI} dpi)")
 
-        all_data = b""
-
-        for idx, label in enumerate(labels):
-            is_first = idx == 0
-            is_last = idx == len(labels) - 1
-
-            # Prepare label
-            label.prepare(tape_config.print_pins, self.RESOLUTION_DPI)
-            image = label.image
-            img_1bit = self._prepare_image(image, tape_config)
-            raster = self._generate_raster(img_1bit, tape_config)
-            num_lines = image.width
-
-            logger.info(f"Label {idx + 1}/{len(labels)}: {image.size}, {num_lines} columns")
-
-            # Build control sequence for this page
-            # Half-cut mode: auto_cut=OFF, half_cut=ON → half-cuts between, full cut after last
-            # Full-cut mode: auto_cut=ON, half_cut=OFF → full cuts between all labels
-            control_seq = self._build_page_control_sequence(
-                num_lines=num_lines,
-                margin=margin_dots,
-                tape_width_mm=tape_width_mm,
-                high_resolution=high_res,
-                is_first_page=is_first,  # Only first label gets invalidate/init
-                auto_cut=not half_cut,  # ON for full-cut mode, OFF for half-cut mode
-                half_cut=half_cut,  # ON for half-cuts between labels
-                chain_printing=False,  # OFF (bit 3 set) - each page independent
-            )
-
-            raster_data = self._build_raster_data(raster, num_lines, high_res)
-
-            all_data += control_seq + raster_data
-
-            # FF (0x0C) for non-last pages, Control-Z (0x1A) for last page
-            if is_last:
-                all_data += b"\x1a"
-            else:
-                all_data += b"\x0c"
-
-        # End with invalidate and initialize (same as single print)
-        all_data += self._cmd_invalidate_and_initialize()
-
-        # Send all data to printer in one write
-        self.connection.write(all_data)
+        # Batch all writes into one transfer to avoid TCP fragmentation issues
+        self.connection.begin_batch()
+
+        try:
+            # Pipeline rendering and sending: a single worker thread renders label
+            # i+1 (PIL releases the GIL in its C rasterization loops) while this
+            # thread writes label i, so at most two rendered labels are held in
+            # memory at a time and the byte stream is unchanged.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(self._render_label, labels[0], tape_config, high_res)
+
+                for idx in range(len(labels)):
+                    is_first = idx == 0
+                    is_last = idx == len(labels) - 1
+
+                    raster_data, num_lines, image_size = future.result()
+                    if not is_last:
+                        future = executor.submit(
+                            self._render_label, labels[idx + 1], tape_config, high_res
+                        )
+
+                    logger.info(f"Label {idx + 1}/{len(labels)}: {image_size}, {num_lines} columns")
+
+                    # Build control sequence for this page
+                    # Half-cut mode: auto_cut=OFF, half_cut=ON → half-cuts between, full cut after
+                    # Full-cut mode: auto_cut=ON, half_cut=OFF → full cuts between all labels
+                    control_seq = self._build_page_control_sequence(
+                        num_lines=num_lines,
+                        margin=margin_dots,
+                        tape_width_mm=tape_width_mm,
+                        high_resolution=high_res,
+                        is_first_page=is_first,  # Only first label gets invalidate/init
+                        auto_cut=not half_cut,  # ON for full-cut mode, OFF for half-cut mode
+                        half_cut=half_cut,  # ON for half-cuts between labels
+                        chain_printing=False,  # OFF (bit 3 set) - each page independent
+                    )
+
+                    self.connection.write(control_seq)
+                    self.connection.write(raster_data)
+
+                    # FF (0x0C) for non-last pages, Control-Z (0x1A) for last page
+                    self.connection.write(b"\x1a" if is_last else b"\x0c")
+
+            # End with invalidate and initialize (same as single print)
+            self.connection.write(self._cmd_invalidate_and_initialize())
+        except BaseException:
+            # Drop the partial batch (a failed render would otherwise leave
+            # the connection buffering every later write, never sending)
+            self.connection.abort_batch()
+            raise
+        self.connection.end_batch()
 
         logger.info(f"Sent all data for {len(labels)} labels to printer.")
@@ -20,10 +20,15 @@ class MockConnection(Connection):
     """Mock connection that captures data sent to the printer."""
 
     def __init__(self) -> None:
-        self.data: bytes = b""
+        self._chunks: list[bytes] = []
         self.closed = False
         self.connected = False
 
+    @property
+    def data(self) -> bytes:
+        """All data written so far."""
+        return b"".join(self._chunks)
+
     def connect(self, printer: object) -> None:
         """Mock connect - just mark as connected."""
         del printer  # unused
@@ -31,7 +36,7 @@ class MockConnection(Connection):
 
     def write(self, payload: bytes) -> None:
         """Capture data instead of sending it."""
-        self.data += payload
+        self._chunks.append(payload)
 
     def close(self) -> None:
         """Mark connection as closed."""
@@ -44,43 +49,43 @@ def mock_connection() -> MockConnection:
     return MockConnection()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_image() -> Image.Image:
     """Create a simple test image."""
     img = Image.new("RGB", (100, 50), color=(255, 255, 255))
     return img
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_image_with_content() -> Image.Image:
     """Create a test image with some black content."""
     img = Image.new("RGB", (100, 50), color=(255, 255, 255))
-    # Draw a black rectangle in the center
-    for x in range(25, 75):
-        for y in range(10, 40):
-            img.putpixel((x, y), (0, 0, 0))
+    # Draw a black rectangle in the center (single C-level fill instead of
+    # 1500 putpixel round-trips). Deliberately not numpy/numba: for a
+    # 100x50 fixture a JIT or array dependency buys nothing over paste.
+    img.paste((0, 0, 0), (25, 10, 75, 40))
     return img
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tape_6mm() -> LaminatedTape6mm:
     """Provide a 6mm laminated tape instance."""
     return LaminatedTape6mm()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tape_12mm() -> LaminatedTape12mm:
     """Provide a 12mm laminated tape instance."""
     return LaminatedTape12mm()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tape_24mm() -> LaminatedTape24mm:
     """Provide a 24mm laminated tape instance."""
     return LaminatedTape24mm()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tape_36mm() -> LaminatedTape36mm:
     """Provide a 36mm laminated tape instance."""
     return LaminatedTape36mm()
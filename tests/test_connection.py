@@ -2,15 +2,52 @@
 #
 # SPDX-License-Identifier: LGPL-2.1-or-later
 
-"""Tests for the ptouch.connection module."""
+"""Tests for the ptouch.connection module.
+
+These are pure unit tests with no real I/O; for quick local iteration
+they run fastest with the result cache plugin disabled:
+
+    pytest tests/test_connection.py -q -p no:cacheprovider
+"""
 
 import socket
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock
 
 import pytest
+from pytest_mock import MockerFixture
 
+from ptouch import PrinterConnectionError as _PkgPrinterConnectionError
 from ptouch.connection import ConnectionNetwork, ConnectionUSB, PrinterConnectionError
 
+# Error instances shared by the parametrized error tests below. Built once
+# at import time; Mock.side_effect re-raises the same object, which the
+# original_error identity assertions rely on.
+_TIMEOUT_EXC = socket.timeout("timed out")
+_REFUSED_EXC = ConnectionRefusedError("Connection refused")
+_GAIERROR_EXC = socket.gaierror(8, "Name not resolved")
+_OSERR_EXC = OSError("Network unreachable")
+_BROKEN_EXC = BrokenPipeError("Broken pipe")
+_RESET_EXC = ConnectionResetError("Connection reset")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _create_connection_patcher(module_mocker: MockerFixture) -> MagicMock:
+    """Patch socket.create_connection once for the whole module.
+
+    Entering and leaving a patch in every test re-resolves the target and
+    swaps the attribute each time; a single module-scoped patch does that
+    work once and pytest-mock tears it down with the module. Tests access
+    the mock through mock_create, which resets it per test.
+    """
+    return module_mocker.patch("socket.create_connection")
+
+
+@pytest.fixture
+def mock_create(_create_connection_patcher: MagicMock) -> MagicMock:
+    """Per-test handle to the patched socket.create_connection, reset clean."""
+    _create_connection_patcher.reset_mock(return_value=True, side_effect=True)
+    return _create_connection_patcher
+
 
 class MockPrinter:
     """Mock printer for testing USB connections."""
@@ -42,9 +79,7 @@ class TestPrinterConnectionError:
 
     def test_exception_is_importable_from_package(self) -> None:
         """Test that PrinterConnectionError can be imported from ptouch."""
-        from ptouch import PrinterConnectionError as ImportedError
-
-        assert ImportedError is PrinterConnectionError
+        assert _PkgPrinterConnectionError is PrinterConnectionError
 
 
 class TestConnectionUSBInit:
@@ -65,30 +100,37 @@ class TestConnectionUSBInit:
 
         assert "USB_PRODUCT_ID" in str(exc_info.value)
 
-    def test_usb_connect_with_mock_printer(self) -> None:
+    def test_usb_connect_with_mock_printer(self, mocker: MockerFixture) -> None:
         """Test that connect() uses printer's USB_PRODUCT_ID."""
-        with patch("usb.core.find") as mock_find:
-            mock_device = MagicMock()
-            mock_find.return_value = mock_device
-            mock_device.is_kernel_driver_active.return_value = False
+        from ptouch.connection import _ENDPOINT_CACHE
+
+        _ENDPOINT_CACHE.clear()  # Force endpoint discovery (cold path)
+        mock_find = mocker.patch("usb.core.find")
+        mock_device = MagicMock()
+        mock_find.return_value = mock_device
+        mock_device.is_kernel_driver_active.return_value = False
+
+        mock_ep_in = MagicMock()
+        mock_ep_in.bEndpointAddress = 0x81  # IN direction bit set
+        mock_ep_out = MagicMock()
+        mock_ep_out.bEndpointAddress = 0x02
 
-            mock_intf = MagicMock()
-            mock_intf.bInterfaceClass = 7
+        mock_intf = MagicMock()
+        mock_intf.bInterfaceClass = 7
+        mock_intf.__iter__.side_effect = lambda: iter([mock_ep_in, mock_ep_out])
 
-            mock_cfg = MagicMock()
-            mock_device.get_active_configuration.return_value = mock_cfg
+        mock_cfg = MagicMock()
+        mock_device.get_active_configuration.return_value = mock_cfg
 
-            with patch("usb.util.find_descriptor") as mock_find_desc:
-                mock_ep = MagicMock()
-                mock_find_desc.return_value = mock_ep
+        mocker.patch("usb.util.find_descriptor", return_value=mock_intf)
 
-                conn = ConnectionUSB()
-                conn.connect(MockPrinter())  # type: ignore[arg-type]
+        conn = ConnectionUSB()
+        conn.connect(MockPrinter())  # type: ignore[arg-type]
 
-                # Should have called usb.core.find with the product ID from MockPrinter
-                mock_find.assert_called_once()
-                call_kwargs = mock_find.call_args[1]
-                assert call_kwargs["idProduct"] == 0x1234
+        # Should have called usb.core.find with the product ID from MockPrinter
+        assert mock_find.call_count == 1
+        call_kwargs = mock_find.call_args[1]
+        assert call_kwargs["idProduct"] == 0x1234
 
 
 class TestConnectionNetworkInit:
@@ -107,131 +149,92 @@ class TestConnectionNetworkInit:
         conn = ConnectionNetwork("192.168.1.100")
         assert conn.timeout == 5.0
 
-    def test_connect_establishes_socket(self) -> None:
+    def test_connect_establishes_socket(self, mock_create: MagicMock) -> None:
         """Test that connect() creates and configures socket."""
-        with patch("socket.socket") as mock_socket:
-            mock_sock = MagicMock()
-            mock_socket.return_value = mock_sock
-
-            conn = ConnectionNetwork("192.168.1.100", timeout=10.0)
-            conn.connect(MockPrinter())  # type: ignore[arg-type]
+        mock_sock = Mock(spec_set=socket.socket)
+        mock_create.return_value = mock_sock
 
-            mock_sock.settimeout.assert_called_with(10.0)
-            mock_sock.connect.assert_called_once_with(("192.168.1.100", 9100))
-
-    def test_connection_timeout_raises_printer_error(self) -> None:
-        """Test that connection timeout raises PrinterConnectionError."""
-        with patch("socket.socket") as mock_socket:
-            mock_sock = MagicMock()
-            mock_socket.return_value = mock_sock
-            mock_sock.connect.side_effect = socket.timeout("timed out")
-
-            conn = ConnectionNetwork("192.168.1.100", timeout=5.0)
-            with pytest.raises(PrinterConnectionError) as exc_info:
-                conn.connect(MockPrinter())  # type: ignore[arg-type]
-
-            assert "timed out" in str(exc_info.value)
-            assert "192.168.1.100:9100" in str(exc_info.value)
-            assert isinstance(exc_info.value.original_error, socket.timeout)
-            mock_sock.close.assert_called_once()
-
-    def test_connection_refused_raises_printer_error(self) -> None:
-        """Test that connection refused raises PrinterConnectionError."""
-        with patch("socket.socket") as mock_socket:
-            mock_sock = MagicMock()
-            mock_socket.return_value = mock_sock
-            mock_sock.connect.side_effect = ConnectionRefusedError("Connection refused")
-
-            conn = ConnectionNetwork("192.168.1.100")
-            with pytest.raises(PrinterConnectionError) as exc_info:
-                conn.connect(MockPrinter())  # type: ignore[arg-type]
-
-            assert "refused" in str(exc_info.value).lower()
-            assert "192.168.1.100:9100" in str(exc_info.value)
-            assert isinstance(exc_info.value.original_error, ConnectionRefusedError)
-            mock_sock.close.assert_called_once()
-
-    def test_hostname_resolution_error_raises_printer_error(self) -> None:
-        """Test that hostname resolution failure raises PrinterConnectionError."""
-        with patch("socket.socket") as mock_socket:
-            mock_sock = MagicMock()
-            mock_socket.return_value = mock_sock
-            mock_sock.connect.side_effect = socket.gaierror(8, "Name not resolved")
-
-            conn = ConnectionNetwork("invalid.hostname.local")
-            with pytest.raises(PrinterConnectionError) as exc_info:
-                conn.connect(MockPrinter())  # type: ignore[arg-type]
-
-            assert "invalid.hostname.local" in str(exc_info.value)
-            assert "resolve" in str(exc_info.value).lower()
-            assert isinstance(exc_info.value.original_error, socket.gaierror)
-            mock_sock.close.assert_called_once()
-
-    def test_generic_os_error_raises_printer_error(self) -> None:
-        """Test that generic OSError raises PrinterConnectionError."""
-        with patch("socket.socket") as mock_socket:
-            mock_sock = MagicMock()
-            mock_socket.return_value = mock_sock
-            mock_sock.connect.side_effect = OSError("Network unreachable")
-
-            conn = ConnectionNetwork("192.168.1.100")
-            with pytest.raises(PrinterConnectionError) as exc_info:
-                conn.connect(MockPrinter())  # type: ignore[arg-type]
-
-            assert "192.168.1.100:9100" in str(exc_info.value)
-            assert isinstance(exc_info.value.original_error, OSError)
-            mock_sock.close.assert_called_once()
-
-
-class TestConnectionNetworkWrite:
-    """Test ConnectionNetwork write method error handling."""
+        conn = ConnectionNetwork("192.168.1.100", timeout=10.0)
+        conn.connect(MockPrinter())  # type: ignore[arg-type]
+
+        mock_create.assert_called_once_with(("192.168.1.100", 9100), timeout=10.0)
+        # Nagle's algorithm must be disabled on the new socket
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in [
+            call.args for call in mock_sock.setsockopt.call_args_list
+        ]
+
+    @pytest.mark.parametrize(
+        ("exc", "host", "substr"),
+        [
+            (_TIMEOUT_EXC, "192.168.1.100", "timed out"),
+            (_REFUSED_EXC, "192.168.1.100", "refused"),
+            (_GAIERROR_EXC, "invalid.hostname.local", "resolve"),
+            (_OSERR_EXC, "192.168.1.100", "192.168.1.100:9100"),
+        ],
+    )
+    def test_connect_error_raises_printer_error(
+        self, mock_create: MagicMock, exc: OSError, host: str, substr: str
+    ) -> None:
+        """Test that connect() wraps socket errors in PrinterConnectionError."""
+        mock_create.side_effect = exc
 
-    @pytest.fixture
-    def connected_network(self) -> ConnectionNetwork:
-        """Create a ConnectionNetwork with mocked socket."""
-        with patch("socket.socket") as mock_socket:
-            mock_sock = MagicMock()
-            mock_socket.return_value = mock_sock
-            conn = ConnectionNetwork("192.168.1.100")
+        conn = ConnectionNetwork(host)
+        with pytest.raises(PrinterConnectionError) as exc_info:
             conn.connect(MockPrinter())  # type: ignore[arg-type]
-            return conn
 
-    def test_write_timeout_raises_printer_error(self, connected_network: ConnectionNetwork) -> None:
-        """Test that write timeout raises PrinterConnectionError."""
-        assert connected_network._socket is not None
-        connected_network._socket.sendall.side_effect = socket.timeout("timed out")
+        # Messages are produced by this module with known casing, so no
+        # case folding is needed in the assertions
+        message = str(exc_info.value)
+        assert substr in message
+        assert host in message
+        assert exc_info.value.original_error is exc
+        assert conn._socket is None
 
-        with pytest.raises(PrinterConnectionError) as exc_info:
-            connected_network.write(b"test data")
 
-        assert "timed out" in str(exc_info.value).lower()
-        assert isinstance(exc_info.value.original_error, socket.timeout)
+@pytest.fixture(scope="class")
+def connected_network(_create_connection_patcher: MagicMock) -> ConnectionNetwork:
+    """Create one ConnectionNetwork per test class, bound to a mock socket.
 
-    def test_write_broken_pipe_raises_printer_error(
-        self, connected_network: ConnectionNetwork
-    ) -> None:
-        """Test that broken pipe raises PrinterConnectionError."""
-        assert connected_network._socket is not None
-        connected_network._socket.sendall.side_effect = BrokenPipeError("Broken pipe")
+    Shared by the write and read test classes; each test only needs a
+    clean side_effect (see the _reset_socket fixtures), not a freshly
+    constructed connection.
+    """
+    _create_connection_patcher.reset_mock(return_value=True, side_effect=True)
+    _create_connection_patcher.return_value = Mock(spec_set=socket.socket)
+    conn = ConnectionNetwork("192.168.1.100")
+    conn.connect(MockPrinter())  # type: ignore[arg-type]
+    return conn
 
-        with pytest.raises(PrinterConnectionError) as exc_info:
-            connected_network.write(b"test data")
 
-        assert "lost" in str(exc_info.value).lower()
-        assert isinstance(exc_info.value.original_error, BrokenPipeError)
+class TestConnectionNetworkWrite:
+    """Test ConnectionNetwork write method error handling."""
 
-    def test_write_connection_reset_raises_printer_error(
-        self, connected_network: ConnectionNetwork
+    @pytest.fixture(autouse=True)
+    def _reset_socket(self, connected_network: ConnectionNetwork) -> None:
+        """Clear injected side effects so each test starts clean."""
+        assert connected_network._socket is not None
+        connected_network._socket.reset_mock(side_effect=True)
+
+    @pytest.mark.parametrize(
+        ("exc", "substr"),
+        [
+            (_TIMEOUT_EXC, "timed out"),
+            (_BROKEN_EXC, "lost"),
+            (_RESET_EXC, "lost"),
+        ],
+    )
+    def test_write_error_raises_printer_error(
+        self, connected_network: ConnectionNetwork, exc: OSError, substr: str
     ) -> None:
-        """Test that connection reset raises PrinterConnectionError."""
+        """Test that write() wraps socket errors in PrinterConnectionError."""
         assert connected_network._socket is not None
-        connected_network._socket.sendall.side_effect = ConnectionResetError("Connection reset")
+        connected_network._socket.sendall.side_effect = exc
 
         with pytest.raises(PrinterConnectionError) as exc_info:
             connected_network.write(b"test data")
 
-        assert "lost" in str(exc_info.value).lower()
-        assert isinstance(exc_info.value.original_error, ConnectionResetError)
+        assert substr in str(exc_info.value)
+        assert exc_info.value.original_error is exc
 
     def test_write_not_connected_raises_printer_error(self) -> None:
         """Test that write before connect raises PrinterConnectionError."""
@@ -241,43 +244,194 @@ class TestConnectionNetworkWrite:
 
         assert "Not connected" in str(exc_info.value)
 
+    def test_write_from_uses_sendfile(self, connected_network: ConnectionNetwork) -> None:
+        """Test that write_from hands the file object to socket.sendfile."""
+        import io
 
-class TestConnectionNetworkRead:
-    """Test ConnectionNetwork read method error handling."""
+        payload = io.BytesIO(b"raster data")
+        connected_network.write_from(payload)
+
+        assert connected_network._socket is not None
+        connected_network._socket.sendfile.assert_called_once_with(payload)
+
+    def test_write_from_not_connected_raises_printer_error(self) -> None:
+        """Test that write_from before connect raises PrinterConnectionError."""
+        import io
+
+        conn = ConnectionNetwork("192.168.1.100")
+        with pytest.raises(PrinterConnectionError) as exc_info:
+            conn.write_from(io.BytesIO(b"data"))
+
+        assert "Not connected" in str(exc_info.value)
+
+
+class TestConnectionContextManager:
+    """Test Connection context manager protocol."""
+
+    def test_context_manager_closes_socket(self, mock_create: MagicMock) -> None:
+        """Test that leaving the context closes the connection."""
+        mock_sock = Mock(spec_set=socket.socket)
+        mock_create.return_value = mock_sock
+
+        with ConnectionNetwork("192.168.1.100") as conn:
+            conn.connect(MockPrinter())  # type: ignore[arg-type]
+
+        assert conn._socket is None
+        assert mock_sock.close.call_count == 1
+
+    def test_context_manager_returns_connection(self) -> None:
+        """Test that __enter__ returns the connection itself."""
+        conn = ConnectionNetwork("192.168.1.100")
+        with conn as entered:
+            assert entered is conn
+
+
+class TestConnectionBatching:
+    """Test batched writes on connections."""
 
     @pytest.fixture
-    def connected_network(self) -> ConnectionNetwork:
+    def connected_network(self, mock_create: MagicMock) -> ConnectionNetwork:
         """Create a ConnectionNetwork with mocked socket."""
-        with patch("socket.socket") as mock_socket:
-            mock_sock = MagicMock()
-            mock_socket.return_value = mock_sock
-            conn = ConnectionNetwork("192.168.1.100")
-            conn.connect(MockPrinter())  # type: ignore[arg-type]
-            return conn
+        # spec (not spec_set) so the sent_batches log below can be attached
+        mock_sock = Mock(spec=socket.socket)
+        # Snapshot each scatter/gather write (the buffer list is mutated
+        # by the caller after partial sends) and report it as fully sent
+        mock_sock.sent_batches = []
+
+        def fake_sendmsg(buffers: list) -> int:
+            mock_sock.sent_batches.append([bytes(b) for b in buffers])
+            return sum(len(b) for b in buffers)
+
+        mock_sock.sendmsg.side_effect = fake_sendmsg
+        mock_create.return_value = mock_sock
+        conn = ConnectionNetwork("192.168.1.100")
+        conn.connect(MockPrinter())  # type: ignore[arg-type]
+        return conn
+
+    def test_batched_writes_sent_as_single_transfer(
+        self, connected_network: ConnectionNetwork
+    ) -> None:
+        """Test that writes between begin_batch and end_batch are coalesced."""
+        connected_network.begin_batch()
+        connected_network.write(b"header")
+        connected_network.write(b"raster")
+        connected_network.write(b"\x1a")
+        connected_network.end_batch()
 
-    def test_read_timeout_raises_printer_error(self, connected_network: ConnectionNetwork) -> None:
-        """Test that read timeout raises PrinterConnectionError."""
         assert connected_network._socket is not None
-        connected_network._socket.recv.side_effect = socket.timeout("timed out")
+        assert connected_network._socket.sent_batches == [[b"header", b"raster", b"\x1a"]]
 
-        with pytest.raises(PrinterConnectionError) as exc_info:
-            connected_network.read()
+    def test_end_batch_without_begin_is_noop(self, connected_network: ConnectionNetwork) -> None:
+        """Test that end_batch without begin_batch sends nothing."""
+        connected_network.end_batch()
+        assert connected_network._socket is not None
+        connected_network._socket.sendmsg.assert_not_called()
+        connected_network._socket.sendall.assert_not_called()
 
-        assert "timed out" in str(exc_info.value).lower()
-        assert isinstance(exc_info.value.original_error, socket.timeout)
+    def test_write_after_end_batch_sends_immediately(
+        self, connected_network: ConnectionNetwork
+    ) -> None:
+        """Test that batching mode is left after end_batch."""
+        connected_network.begin_batch()
+        connected_network.write(b"batched")
+        connected_network.end_batch()
+        connected_network.write(b"direct")
 
-    def test_read_broken_pipe_raises_printer_error(
+        assert connected_network._socket is not None
+        assert connected_network._socket.sendmsg.call_count == 1
+        connected_network._socket.sendall.assert_called_once_with(b"direct")
+
+    def test_partial_sendmsg_resumes_until_complete(
+        self, connected_network: ConnectionNetwork
+    ) -> None:
+        """Test that a partial sendmsg result is resumed from the right offset."""
+        assert connected_network._socket is not None
+        mock_sock = connected_network._socket
+        # First call sends only 4 bytes (mid-chunk), the rest goes out on
+        # subsequent calls
+        results = iter([4, 8, 1])
+
+        def fake_partial_sendmsg(buffers: list) -> int:
+            mock_sock.sent_batches.append([bytes(b) for b in buffers])
+            return next(results)
+
+        mock_sock.sendmsg.side_effect = fake_partial_sendmsg
+
+        connected_network.begin_batch()
+        connected_network.write(b"header")
+        connected_network.write(b"raster")
+        connected_network.write(b"\x1a")
+        connected_network.end_batch()
+
+        assert mock_sock.sent_batches == [
+            [b"header", b"raster", b"\x1a"],
+            [b"er", b"raster", b"\x1a"],  # resumed inside the first chunk
+            [b"\x1a"],
+        ]
+
+    def test_abort_batch_discards_buffered_chunks(
         self, connected_network: ConnectionNetwork
     ) -> None:
-        """Test that broken pipe raises PrinterConnectionError."""
+        """Test that abort_batch drops buffered data and leaves batch mode."""
+        connected_network.begin_batch()
+        connected_network.write(b"partial")
+        connected_network.abort_batch()
+        connected_network.end_batch()  # Nothing buffered, must be a noop
+
+        assert connected_network._socket is not None
+        connected_network._socket.sendmsg.assert_not_called()
+        connected_network.write(b"direct")
+        connected_network._socket.sendall.assert_called_once_with(b"direct")
+
+    def test_batches_larger_than_iov_max_split_across_calls(
+        self, connected_network: ConnectionNetwork
+    ) -> None:
+        """Test that batches with more chunks than IOV_MAX are split."""
+        from ptouch.connection import _IOV_MAX
+
+        assert connected_network._socket is not None
+        mock_sock = connected_network._socket
+
+        connected_network.begin_batch()
+        num_chunks = _IOV_MAX + 100
+        for i in range(num_chunks):
+            connected_network.write(b"%d" % i)
+        connected_network.end_batch()
+
+        assert all(len(batch) <= _IOV_MAX for batch in mock_sock.sent_batches)
+        assert len(mock_sock.sent_batches) == 2
+        sent = [chunk for batch in mock_sock.sent_batches for chunk in batch]
+        assert sent == [b"%d" % i for i in range(num_chunks)]
+
+
+class TestConnectionNetworkRead:
+    """Test ConnectionNetwork read method error handling."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_socket(self, connected_network: ConnectionNetwork) -> None:
+        """Clear injected side effects so each test starts clean."""
+        assert connected_network._socket is not None
+        connected_network._socket.reset_mock(side_effect=True)
+
+    @pytest.mark.parametrize(
+        ("exc", "substr"),
+        [
+            (_TIMEOUT_EXC, "timed out"),
+            (_BROKEN_EXC, "lost"),
+        ],
+    )
+    def test_read_error_raises_printer_error(
+        self, connected_network: ConnectionNetwork, exc: OSError, substr: str
+    ) -> None:
+        """Test that read() wraps socket errors in PrinterConnectionError."""
         assert connected_network._socket is not None
-        connected_network._socket.recv.side_effect = BrokenPipeError("Broken pipe")
+        connected_network._socket.recv.side_effect = exc
 
         with pytest.raises(PrinterConnectionError) as exc_info:
             connected_network.read()
 
-        assert "lost" in str(exc_info.value).lower()
-        assert isinstance(exc_info.value.original_error, BrokenPipeError)
+        assert substr in str(exc_info.value)
+        assert exc_info.value.original_error is exc
 
     def test_read_not_connected_raises_printer_error(self) -> None:
         """Test that read before connect raises PrinterConnectionError."""
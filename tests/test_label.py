@@ -7,7 +7,7 @@
 import pytest
 from PIL import Image, ImageFont
 
-from ptouch.label import Align, Label, TextLabel
+from ptouch.label import Align, Label, TextLabel, _load_font
 from ptouch.tape import LaminatedTape12mm, LaminatedTape36mm
 
 
@@ -166,11 +166,110 @@ class TestTextLabel:
         img2 = label.image
         assert img1 is img2
 
-    def test_text_label_image_is_rgb(self, font_path: str) -> None:
-        """Test that rendered image is RGB mode."""
+    def test_text_label_image_is_grayscale(self, font_path: str) -> None:
+        """Test that rendered image is grayscale (L) mode."""
         label = TextLabel("Hello", LaminatedTape36mm, font_path)
         label.prepare(height=100)
-        assert label.image.mode == "RGB"
+        assert label.image.mode == "L"
+
+    def test_text_label_default_config_binds_fast_prepare(self, font_path: str) -> None:
+        """Test that default labels use the specialized prepare and render identically."""
+        fast = TextLabel("Hello", LaminatedTape36mm, font_path)
+        assert fast.prepare.__func__ is TextLabel._prepare_fast
+        # A non-default option keeps the generic prepare
+        generic = TextLabel("Hello", LaminatedTape36mm, font_path, min_width_mm=1.0)
+        assert generic.prepare.__func__ is TextLabel.prepare
+        fast.prepare(height=100)
+        generic.prepare(height=100)
+        assert fast.image.tobytes() == generic.image.tobytes()
+
+    @pytest.mark.parametrize("text", ["Hello", "jumpy Quartz 123", "."])
+    def test_render_text_matches_imagedraw(self, font_path: str, text: str) -> None:
+        """Test that the mask-paste render path is pixel-identical to ImageDraw.text.
+
+        _render_text pastes the FreeType glyph mask directly instead of
+        going through ImageDraw; this guards that shortcut (which relies
+        on Image.Image()._new) against Pillow behavior changes.
+        """
+        from PIL import ImageDraw
+
+        from ptouch.label import _render_text
+
+        font = ImageFont.truetype(font_path, size=24)
+        image = _render_text(font, text, 100, 360, None, halign=1, valign=1)
+
+        bbox = font.getbbox(text)
+        reference = Image.new("L", image.size, 255)
+        text_x = (image.width - bbox[0] - bbox[2]) // 2
+        text_y = (image.height - bbox[1] - bbox[3]) // 2
+        ImageDraw.Draw(reference).text((text_x, text_y), text, font=font, fill=0)
+        assert image.tobytes() == reference.tobytes()
+
+    def test_text_label_render_cache_hits_for_repeated_content(self, font_path: str) -> None:
+        """Test that identical render inputs are served from the render cache."""
+        from ptouch.label import _render_raw
+
+        _render_raw.cache_clear()
+        first = TextLabel("Same", LaminatedTape36mm, font_path)
+        second = TextLabel("Same", LaminatedTape36mm, font_path)
+        first.prepare(height=100)
+        second.prepare(height=100)
+        assert _render_raw.cache_info().hits == 1
+        assert first.image.tobytes() == second.image.tobytes()
+
+    def test_text_label_oversized_render_bypasses_cache(
+        self, font_path: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that oversized renders are not pinned in the render cache."""
+        import ptouch.label as label_module
+
+        monkeypatch.setattr(label_module, "_LARGE_CANVAS_BYTES", 1)
+        label_module._render_raw.cache_clear()
+        label = TextLabel("Huge", LaminatedTape36mm, font_path)
+        label.prepare(height=100)
+        assert label.image.height == 100
+        # The cached entry is only the size sentinel, not the pixel data
+        data, size = label_module._render_raw("Huge", font_path, 80, 100, 180, None, 1, 1)
+        assert data is None
+        assert size == label.image.size
+        label_module._render_raw.cache_clear()
+
+    def test_text_label_prepare_batch_renders_all(self, font_path: str) -> None:
+        """Test that prepare_batch() renders every label in the list."""
+        labels = [TextLabel(text, LaminatedTape36mm, font_path) for text in ("A", "B", "C")]
+        TextLabel.prepare_batch(labels, height=100)
+        for label in labels:
+            assert isinstance(label.image, Image.Image)
+            assert label.image.height == 100
+
+    def test_text_label_prepare_batch_skips_rendered(self, font_path: str) -> None:
+        """Test that prepare_batch() leaves already-rendered labels untouched."""
+        label = TextLabel("Hello", LaminatedTape36mm, font_path)
+        label.prepare(height=100)
+        img = label.image
+        TextLabel.prepare_batch([label], height=200)
+        assert label.image is img
+
+    def test_text_label_release_returns_canvas_to_pool(self, font_path: str) -> None:
+        """Test that release() frees the image and the pool reuses the canvas.
+
+        Uses a pre-loaded font, which renders through the pool directly
+        instead of the content-addressed cache for path fonts.
+        """
+        font = ImageFont.truetype(font_path, size=24)
+        label = TextLabel("Hello", LaminatedTape36mm, font)
+        label.prepare(height=100)
+        canvas = label.image
+        label.release()
+        with pytest.raises(RuntimeError, match="not been rendered yet"):
+            _ = label.image
+        label.prepare(height=100)  # Same text/height, so same canvas size
+        assert label.image is canvas
+
+    def test_text_label_font_cache_reuses_instances(self, font_path: str) -> None:
+        """Test that identical (path, size) pairs share one cached font."""
+        _load_font.cache_clear()
+        assert _load_font(font_path, 24) is _load_font(font_path, 24)
 
     def test_text_label_different_alignments(self, font_path: str) -> None:
         """Test that different alignments produce valid images."""
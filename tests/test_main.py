@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2024-2026 Nicolai Buchwitz <nb@tipi-net.de>
+#
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+"""Tests for the fast CLI argument parser in ptouch.__main__."""
+
+import pytest
+
+from ptouch.__main__ import _build_parser, _fast_parse
+
+# Required arguments shared by the accepted invocations below
+_BASE = ["--host", "192.168.1.100", "--printer", "P900", "--tape-width", "36"]
+
+
+class TestFastParse:
+    """Test that _fast_parse agrees with the full argparse parser.
+
+    The fast parser must either produce exactly the namespace argparse
+    would, or return None so the caller falls back to argparse.
+    """
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["Hello World", *_BASE],
+            ["Label 1", "Label 2", "Label 3", *_BASE, "--copies", "3", "--full-cut"],
+            ["Hi", "-H", "192.168.1.100", "-p", "E550W", "-t", "12", "-f", "font.ttf"],
+            ["--usb", "--image", "logo.png", "--printer", "E550W", "--tape-width", "12"],
+            ["Hi", *_BASE, "--align", "left", "top"],
+            ["Hi", *_BASE, "--font-size", "48", "--high-resolution", "--no-compression"],
+            ["Hi", *_BASE, "--margin", "1.5", "--width", "50"],
+        ],
+        ids=[
+            "basic",
+            "multi-label",
+            "short-options",
+            "usb-image",
+            "align",
+            "font-and-resolution",
+            "margin-and-width",
+        ],
+    )
+    def test_accepted_matches_argparse(self, argv: list[str]) -> None:
+        """Test that accepted command lines parse identically to argparse."""
+        namespace = _fast_parse(argv)
+        assert namespace is not None
+        assert vars(namespace) == vars(_build_parser().parse_args(argv))
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["Hello", "--host", "h", "World", "--printer", "P900", "--tape-width", "36"],
+            ["Hi", "--font", "-i.ttf", *_BASE],
+            ["Hi", "--margin", "-5", *_BASE],
+            ["Hi", "--host=192.168.1.100", "--printer", "P900", "--tape-width", "36"],
+            ["Hi", *_BASE, "--unknown"],
+            ["--help"],
+            ["Hi", "--printer", "P900", "--tape-width", "36"],
+            ["Hi", "--host", "h", "--printer", "P900"],
+            ["Hi", "--host", "h", "--usb", "--printer", "P900", "--tape-width", "36"],
+            ["Hi", "--host", "h", "--printer", "Unknown", "--tape-width", "36"],
+            ["Hi", "--host", "h", "--printer", "P900", "--tape-width", "7"],
+            ["Hi", *_BASE, "--align", "left", "diagonal"],
+            ["Hi", *_BASE, "--font"],
+        ],
+        ids=[
+            "text-after-option",
+            "option-like-value",
+            "negative-number-value",
+            "equals-form",
+            "unknown-option",
+            "help",
+            "missing-connection",
+            "missing-tape-width",
+            "host-and-usb",
+            "invalid-printer",
+            "invalid-tape-width",
+            "invalid-align",
+            "trailing-option-without-value",
+        ],
+    )
+    def test_rejected_falls_back_to_argparse(self, argv: list[str]) -> None:
+        """Test that command lines the fast parser cannot handle return None."""
+        assert _fast_parse(argv) is None
@@ -411,6 +411,41 @@ class TestLabelPrinterPrintMulti:
         printer.print_multi(labels, margin_mm=5.0)
         assert len(mock_connection.data) > 0
 
+    def test_print_multi_copies_render_once(self, mock_connection: MockConnection) -> None:
+        """Test that printing copies of the same label reuses the rendered image."""
+        from PIL import ImageFont
+
+        from ptouch.label import TextLabel
+
+        font = ImageFont.load_default()
+        if not isinstance(font, ImageFont.FreeTypeFont):
+            pytest.skip("PIL default font is not scalable")
+
+        printer = PTE550W(mock_connection, use_compression=True)
+        label = TextLabel("Copy", LaminatedTape12mm, font)
+        printer.print_multi([label] * 3)
+        first_image = label.image
+
+        printer.print_multi([label] * 3)
+        # The label must not be re-rendered for subsequent copies/jobs
+        assert label.image is first_image
+
+    def test_print_multi_render_failure_clears_batch_mode(
+        self, mock_connection: MockConnection, sample_image: Image.Image
+    ) -> None:
+        """Test that a failed render does not leave the connection in batch mode."""
+        from ptouch.label import TextLabel
+
+        printer = PTE550W(mock_connection, use_compression=True)
+        labels = [
+            Label(sample_image, LaminatedTape12mm),
+            TextLabel("Hi", LaminatedTape12mm, "/nonexistent/font.ttf"),
+        ]
+        with pytest.raises(OSError):
+            printer.print_multi(labels)
+        # Batch mode must be left, otherwise later writes buffer forever
+        assert mock_connection._batch is None
+
     def test_print_multi_with_high_resolution(
         self, mock_connection: MockConnection, sample_image: Image.Image
     ) -> None: